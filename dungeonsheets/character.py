@@ -1,8 +1,10 @@
 """Tools for describing a player character."""
+import itertools
+import operator
 import os
 import re
 import warnings
-import math
+from functools import lru_cache
 from types import ModuleType
 from typing import Sequence, Union, MutableMapping
 
@@ -21,12 +23,55 @@ from dungeonsheets import (
     weapons,
 )
 from dungeonsheets.content_registry import find_content
+from dungeonsheets.stats import Ability, Skill
 from dungeonsheets.weapons import Weapon
 from dungeonsheets.entity import Entity
 
 
+class _character_cache:
+    """Like :py:func:`functools.cached_property`, for derived character data.
+
+    The value is stored along with :py:meth:`Character._cache_state`,
+    and is recomputed once that changes, eg. when a level is set
+    directly on one of the character's class objects, or a new list
+    of custom features is assigned.
+
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.attrname = name
+
+    def __get__(self, char, owner=None):
+        if char is None:
+            return self
+        state = char._cache_state()
+        cached = char.__dict__.get(self.attrname)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+        value = self.func(char)
+        char.__dict__[self.attrname] = (state, value)
+        return value
+
+    def __set__(self, char, value):
+        raise AttributeError(f"can't set attribute {self.attrname}")
+
+
 dice_re = re.compile(r"(\d+)d(\d+)")
 
+# Sort key for features, spells, etc.
+_NAME_KEY = operator.attrgetter("name")
+
+# Templates for saving characters back to python files (so no escaping)
+jinja_env = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(os.path.join(os.path.dirname(__file__), "forms/")),
+    autoescape=False,
+    auto_reload=False,
+)
+
 __all__ = (
     "Artificer",
     "Barbarian",
@@ -68,6 +113,91 @@ multiclass_spellslots_by_level = {
     20: (0, 4, 3, 3, 3, 3, 2, 2, 1, 1),
 }
 
+# Slots indexed directly by [effective level][spell level]; row 0 is
+# for characters with no effective spellcasting level
+_SLOT_TABLE = ((0,) * 10,) + tuple(
+    multiclass_spellslots_by_level[lvl] for lvl in range(1, 21)
+)
+
+# Classes whose levels count fully, by half or by a third towards
+# multiclass spellcasting (PHB pg 164)
+_FULL_CASTERS = frozenset(
+    {classes.Bard, classes.Cleric, classes.Druid, classes.Sorceror, classes.Wizard}
+)
+_HALF_CASTERS = frozenset({classes.Paladin, classes.Ranger})
+_THIRD_CASTERS = frozenset({classes.Fighter, classes.Rogue})
+
+
+# Custom features that replace a class's "Fighting Style (Select One)"
+_FIGHTING_STYLES = frozenset(
+    {
+        "Fighting Style (Archery)",
+        "Fighting Style (Defense)",
+        "Fighting Style (Dueling)",
+        "Fighting Style (Great Weapon Fighting)",
+        "Fighting Style (Protection)",
+        "Fighting Style (Two-Weapon Fighting)",
+    }
+)
+
+# Warnings already shown for unknown mechanics
+_warned_mechanics = set()
+
+
+@lru_cache(maxsize=None)
+def _synthesize_names(mechanic: str):
+    """Derive a (class name, display name) pair for an unknown mechanic."""
+    # Underscores count as word breaks for str.title(), so one pass
+    # capitalizes every word
+    titled = mechanic.title()
+    return titled.replace("_", ""), titled.replace("_", " ")
+
+
+def _descriptors(Cls, DescriptorType):
+    """Find the *DescriptorType* attributes (eg. skills) of class *Cls*.
+
+    The table is built the first time it is needed and stored on
+    *Cls*, so attributes changed on the class (or its bases) after
+    that are not picked up.
+
+    Returns
+    =======
+    dict
+      The first definition in the MRO of each attribute, keyed by
+      name. This is not a *DescriptorType* if a subclass overrides it.
+
+    """
+    key = "_{}_descriptors".format(DescriptorType.__name__.lower())
+    # Look in the class itself, since a parent's table may be out of date
+    table = Cls.__dict__.get(key)
+    if table is None:
+        mro = Cls.__mro__
+        names = dict.fromkeys(
+            attr
+            for klass in mro
+            for attr, val in vars(klass).items()
+            if isinstance(val, DescriptorType)
+        )
+        table = {
+            attr: next(vars(klass)[attr] for klass in mro if attr in vars(klass))
+            for attr in names
+        }
+        setattr(Cls, key, table)
+    return table
+
+
+@lru_cache()
+def _get_make_sheet():
+    """Import :py:func:`~dungeonsheets.make_sheets.make_sheet` on first use.
+
+    ``make_sheets`` imports this module, so it can't be imported at
+    the top.
+
+    """
+    from dungeonsheets.make_sheets import make_sheet
+
+    return make_sheet
+
 
 def _resolve_mechanic(mechanic, SuperClass, warning_message=None):
     """Take a raw entry in a character sheet and turn it into a usable object.
@@ -105,7 +235,7 @@ def _resolve_mechanic(mechanic, SuperClass, warning_message=None):
     SuperClass : type
       Class to determine whether *mechanic* should just be allowed
       through as is.
-    error_message : str, optional
+    warning_message : str, optional
       A string whose ``str.format()`` method (receiving one positional
       argument *mechanic*) will be used for displaying a warning when an
       unknown mechanic is resolved. If omitted, no warning will be
@@ -118,6 +248,11 @@ def _resolve_mechanic(mechanic, SuperClass, warning_message=None):
       likely be a subclass of *SuperClass* if the other parameters are
       well behaved, but this is not enforced.
 
+    Names of defined content are looked up through the content
+    registry's index, so repeated requests for the same name return
+    the same class. Each distinct warning for an unknown mechanic is
+    only shown once.
+
     """
     is_already_resolved = isinstance(mechanic, type) and issubclass(
         mechanic, SuperClass
@@ -132,20 +267,38 @@ def _resolve_mechanic(mechanic, SuperClass, warning_message=None):
         except AttributeError:
             # No pre-defined mechanic available
             if warning_message is not None:
-                # Emit the warning
+                # Emit the warning, unless it has already been shown
                 msg = warning_message.format(mechanic)
-                warnings.warn(msg)
+                if msg not in _warned_mechanics:
+                    _warned_mechanics.add(msg)
+                    warnings.warn(msg)
             else:
                 # Create a generic message so we can make a docstring later.
                 msg = f'Mechanic "{mechanic}" not defined. Please add it.'
             # Create generic mechanic from the factory
-            class_name = "".join([s.title() for s in mechanic.split("_")])
-            mechanic_name = mechanic.replace("_", " ").title()
+            class_name, mechanic_name = _synthesize_names(mechanic)
             attrs = {"name": mechanic_name, "__doc__": msg, "source": "Unknown"}
             Mechanic = type(class_name, (SuperClass,), attrs)
     return Mechanic
 
 
+def _resolve_many(mechanics, SuperClass, warning_message=None):
+    """Resolve a list of raw character sheet entries.
+
+    Same as calling :py:func:`_resolve_mechanic` on each entry of
+    *mechanics*, which may also be a single string.
+
+    Returns
+    =======
+    list
+      The resolved classes, in the same order as *mechanics*.
+
+    """
+    if isinstance(mechanics, str):
+        mechanics = [mechanics]
+    return [_resolve_mechanic(m, SuperClass, warning_message) for m in mechanics]
+
+
 class Character(Entity):
     """A generic player character."""
 
@@ -171,6 +324,7 @@ class Character(Entity):
     features_and_traits = "Describe any other features and abilities."
 
     _proficiencies_text = list()
+    _warned_hit_dice_faces = False
 
     # Appearance
     portrait = False
@@ -261,6 +415,23 @@ class Character(Entity):
         self.custom_features = list()
         self.feature_choices = list()
 
+    def _cache_state(self):
+        """Everything that cached attributes (eg. features) depend on.
+
+        Lists are compared by value, so both replacing and modifying
+        them in place are picked up.
+
+        """
+        return (
+            tuple((type(c), c.level, c.subclass) for c in self.class_list),
+            self._race,
+            self._background,
+            tuple(self.custom_features),
+            tuple(self.other_weapon_proficiencies),
+            tuple(self._spells),
+            tuple(self._spells_prepared),
+        )
+
     def __str__(self):
         return self.name
 
@@ -413,6 +584,10 @@ class Character(Entity):
                 "level of primary class {:s}".format(self.primary_class.name)
             )
 
+    @_character_cache
+    def _class_names(self):
+        return frozenset(c.name for c in self.class_list)
+
     @property
     def num_classes(self):
         return len(self.class_list)
@@ -438,18 +613,27 @@ class Character(Entity):
             self.hp_max = hp_max
         else:
             const_mod = self.constitution.modifier
-            level_one_hp = self.primary_class.hit_dice_faces + const_mod
-            self.hp_max = level_one_hp
+            primary_class = self.primary_class
+            level_one_hp = primary_class.hit_dice_faces + const_mod
+            hp_max = level_one_hp
             for char_cls in self.class_list:
-                hp_per_lvl = char_cls.hit_dice_faces / 2 + 1 + const_mod
-                levels = char_cls.level
-                if char_cls == self.primary_class:
-                    levels -= 1
+                faces = char_cls.hit_dice_faces
+                # Average roll (faces / 2 + 1) for each level after the first
+                levels = char_cls.level - (char_cls is primary_class)
                 assert levels >= 0
-                self.hp_max += int(hp_per_lvl * levels)
+                hp_max += (faces + 2 + 2 * const_mod) * levels // 2
+            self.hp_max = hp_max
 
     @property
     def weapon_proficiencies(self):
+        return self._weapon_proficiencies
+
+    @weapon_proficiencies.setter
+    def weapon_proficiencies(self, new_weapons):
+        self.other_weapon_proficiencies = tuple(new_weapons)
+
+    @_character_cache
+    def _weapon_proficiencies(self):
         wp = set(self.other_weapon_proficiencies)
         if self.num_classes > 0:
             wp |= set(self.primary_class.weapon_proficiencies)
@@ -462,60 +646,55 @@ class Character(Entity):
             wp |= set(getattr(self.background, "weapon_proficiencies", ()))
         return tuple(wp)
 
-    @weapon_proficiencies.setter
-    def weapon_proficiencies(self, new_weapons):
-        self.other_weapon_proficiencies = tuple(new_weapons)
-
     @property
     def other_weapon_proficiencies_text(self):
         return tuple(w.name for w in self.other_weapon_proficiencies)
 
-    @property
+    @_character_cache
     def features(self):
         fts = set(self.custom_features)
-        fighting_style_defined = False
-        set_of_fighting_styles = {
-            "Fighting Style (Archery)",
-            "Fighting Style (Defense)",
-            "Fighting Style (Dueling)",
-            "Fighting Style (Great Weapon Fighting)",
-            "Fighting Style (Protection)",
-            "Fighting Style (Two-Weapon Fighting)",
-        }
-        for temp_feature in fts:
-            fighting_style_defined = temp_feature.name in set_of_fighting_styles
-            if fighting_style_defined:
-                break
+        fighting_style_defined = any(
+            f.name in _FIGHTING_STYLES for f in self.custom_features
+        )
 
         if not self.has_class:
             return fts
         for c in self.class_list:
-            fts |= set(c.features)
-            for feature in fts:
-                if (
-                    fighting_style_defined
-                    and feature.name == "Fighting Style (Select One)"
-                ):
-                    temp_feature = feature
-                    fts.remove(temp_feature)
-                    break
+            fts.update(c.features)
+        # A chosen fighting style replaces the class placeholder
+        if fighting_style_defined:
+            fts = {f for f in fts if f.name != "Fighting Style (Select One)"}
+        sources = []
         if self.race is not None:
-            fts |= set(getattr(self.race, "features", ()))
+            sources.append(getattr(self.race, "features", ()))
             # some races have level-based features (Ex: Aasimar)
-            if hasattr(self.race, "features_by_level"):
-                for lvl in range(1, self.level + 1):
-                    fts |= set(self.race.features_by_level[lvl])
+            features_upto = getattr(self.race, "_features_upto", None)
+            if features_upto is not None:
+                sources.append(features_upto[min(self.level, 20)])
+            elif hasattr(self.race, "features_by_level"):
+                sources.extend(
+                    self.race.features_by_level[lvl] for lvl in range(1, self.level + 1)
+                )
         if self.background is not None:
-            fts |= set(getattr(self.background, "features", ()))
+            sources.append(getattr(self.background, "features", ()))
+        fts.update(itertools.chain.from_iterable(sources))
 
-        return sorted(tuple(fts), key=(lambda x: x.name))
+        return sorted(fts, key=_NAME_KEY)
 
     @property
     def custom_features_text(self):
         return tuple([f.name for f in self.custom_features])
 
+    @_character_cache
+    def _feature_types(self):
+        # Every class that at least one of the features is an instance of
+        return frozenset(T for f in self.features for T in type(f).__mro__)
+
     def has_feature(self, feat):
-        return any([isinstance(f, feat) for f in self.features])
+        if isinstance(feat, type):
+            return feat in self._feature_types
+        # Eg. a tuple of feature classes
+        return any(isinstance(f, feat) for f in self.features)
 
     @property
     def saving_throw_proficiencies(self):
@@ -537,74 +716,104 @@ class Character(Entity):
 
     @property
     def spellcasting_classes_excluding_warlock(self):
-        return [c for c in self.spellcasting_classes if not type(c) == classes.Warlock]
+        return [c for c in self.spellcasting_classes if type(c) is not classes.Warlock]
 
     @property
     def is_spellcaster(self):
         return len(self.spellcasting_classes) > 0
 
+    @property
+    def _multiclass_spellcasting_level(self):
+        """Effective spellcaster level for multiclass spell slots.
+
+        See PHB pg 164. Warlock levels do not count.
+
+        """
+        eff_level = 0
+        for c in self.spellcasting_classes_excluding_warlock:
+            class_type = type(c)
+            if class_type in _FULL_CASTERS:
+                eff_level += c.level
+            elif class_type in _HALF_CASTERS:
+                eff_level += c.level // 2
+            elif class_type in _THIRD_CASTERS:
+                eff_level += c.level // 3
+            elif class_type is classes.Artificer:
+                eff_level += (c.level + 1) // 2
+        return eff_level
+
     def spell_slots(self, spell_level):
+        casters = self.spellcasting_classes
         warlock_slots = 0
-        for c in self.spellcasting_classes:
+        other_casters = []
+        for c in casters:
             if type(c) is classes.Warlock:
                 warlock_slots = c.spell_slots(spell_level)
-        if len(self.spellcasting_classes_excluding_warlock) == 0:
+            else:
+                other_casters.append(c)
+        if len(other_casters) == 0:
             return warlock_slots
-        if len(self.spellcasting_classes_excluding_warlock) == 1:
-            return (
-                self.spellcasting_classes_excluding_warlock[0].spell_slots(spell_level)
-                + warlock_slots
-            )
+        if len(other_casters) == 1:
+            return other_casters[0].spell_slots(spell_level) + warlock_slots
         else:
             if spell_level == 0:
-                return sum([c.spell_slots(0) for c in self.spellcasting_classes])
+                return sum([c.spell_slots(0) for c in casters])
             else:
-                # compute effective level from PHB pg 164
-                eff_level = 0
-                for c in self.spellcasting_classes_excluding_warlock:
-                    if type(c) in [
-                        classes.Bard,
-                        classes.Cleric,
-                        classes.Druid,
-                        classes.Sorceror,
-                        classes.Wizard,
-                    ]:
-                        eff_level += c.level
-                    elif type(c) in [classes.Paladin, classes.Ranger]:
-                        eff_level += c.level // 2
-                    elif type(c) in [classes.Fighter, classes.Rogue]:
-                        eff_level += c.level // 3
-                    elif type(c) is classes.Artificer:
-                        eff_level += math.ceil(c.level / 2)
-                if eff_level == 0:
-                    return warlock_slots
-                else:
-                    return (
-                        multiclass_spellslots_by_level[eff_level][spell_level]
-                        + warlock_slots
-                    )
+                eff_level = self._multiclass_spellcasting_level
+                return _SLOT_TABLE[eff_level][spell_level] + warlock_slots
 
-    @property
+    def spell_slots_all(self):
+        """Spell slots for every spell level at once.
+
+        Equivalent to calling :py:meth:`spell_slots` for each spell
+        level, but reads each class's whole row of spell slots at
+        once.
+
+        Returns
+        =======
+        slots : tuple
+          Ten entries, indexed by spell level (0 for cantrips).
+
+        """
+        warlock_slots = (0,) * 10
+        for c in self.spellcasting_classes:
+            if type(c) is classes.Warlock:
+                warlock_slots = c.spell_slots_all()
+        casters = self.spellcasting_classes_excluding_warlock
+        if len(casters) == 0:
+            return warlock_slots
+        elif len(casters) == 1:
+            slots = casters[0].spell_slots_all()
+            return tuple(s + w for s, w in zip(slots, warlock_slots))
+        else:
+            eff_level = self._multiclass_spellcasting_level
+            slots = _SLOT_TABLE[eff_level]
+            cantrips = sum([c.spell_slots(0) for c in self.spellcasting_classes])
+            return (cantrips,) + tuple(
+                s + w for s, w in zip(slots[1:], warlock_slots[1:])
+            )
+
+    @_character_cache
     def spells(self):
-        spells = set(self._spells) | set(self._spells_prepared)
+        sources = [self._spells, self._spells_prepared]
         for f in self.features:
-            spells |= set(f.spells_known) | set(f.spells_prepared)
+            sources.extend((f.spells_known, f.spells_prepared))
         for c in self.spellcasting_classes:
-            spells |= set(c.spells_known) | set(c.spells_prepared)
+            sources.extend((c.spells_known, c.spells_prepared))
         if self.race is not None:
-            spells |= set(self.race.spells_known) | set(self.race.spells_prepared)
-        return sorted(tuple(spells), key=(lambda x: x.name))
+            sources.extend((self.race.spells_known, self.race.spells_prepared))
+        spells = set(itertools.chain.from_iterable(sources))
+        return sorted(spells, key=_NAME_KEY)
 
-    @property
+    @_character_cache
     def spells_prepared(self):
-        spells = set(self._spells_prepared)
-        for f in self.features:
-            spells |= set(f.spells_prepared)
-        for c in self.spellcasting_classes:
-            spells |= set(c.spells_prepared)
+        sources = [self._spells_prepared]
+        sources.extend(f.spells_prepared for f in self.features)
+        sources.extend(c.spells_prepared for c in self.spellcasting_classes)
         if self.race is not None:
-            spells |= set(self.race.spells_prepared)
-        return sorted(tuple(spells), key=(lambda x: x.name))
+            sources.append(self.race.spells_prepared)
+        spells = set(itertools.chain.from_iterable(sources))
+        return sorted(spells, key=_NAME_KEY)
 
     def set_attrs(self, **attrs):
         """
@@ -615,35 +824,22 @@ class Character(Entity):
             if attr == "dungeonsheets_version":
                 pass  # Maybe we'll verify this later?
             elif attr == "weapons":
-                if isinstance(val, str):
-                    val = [val]
                 # Treat weapons specially
-                for weap in val:
-                    self.wield_weapon(weap)
+                self.wield_weapons(val)
             elif attr == "magic_items":
-                if isinstance(val, str):
-                    val = [val]
-                for mitem in val:
-                    msg = (
-                        f'Magic Item "{mitem}" not defined. '
-                        "Please add it to ``magic_items.py``"
-                    )
-                    ThisMagicItem = _resolve_mechanic(
-                        mechanic=mitem,
-                        SuperClass=magic_items.MagicItem,
-                        warning_message=msg,
-                    )
-                    self.magic_items.append(ThisMagicItem(owner=self))
+                msg = (
+                    'Magic Item "{}" not defined. '
+                    "Please add it to ``magic_items.py``"
+                )
+                _magic_items = _resolve_many(
+                    val, SuperClass=magic_items.MagicItem, warning_message=msg
+                )
+                self.magic_items.extend(M(owner=self) for M in _magic_items)
             elif attr == "weapon_proficiencies":
                 self.other_weapon_proficiencies = ()
-                msg = 'Magic Item "{}" not defined. Please add it to ``weapons.py``'
+                msg = 'Weapon "{}" not defined. Please add it to ``weapons.py``'
                 wps = set(
-                    [
-                        _resolve_mechanic(
-                            w, SuperClass=weapons.Weapon, warning_message=msg
-                        )
-                        for w in val
-                    ]
+                    _resolve_many(val, SuperClass=weapons.Weapon, warning_message=msg)
                 )
                 wps -= set(self.weapon_proficiencies)
                 self.other_weapon_proficiencies = list(wps)
@@ -652,34 +848,22 @@ class Character(Entity):
             elif attr == "shield":
                 self.wield_shield(val)
             elif attr == "circle":
-                if hasattr(self, "Druid"):
+                if "Druid" in self._class_names:
                     self.Druid.circle = val
             elif attr == "features":
-                if isinstance(val, str):
-                    val = [val]
-                _features = []
-                for f in val:
-                    msg = 'Feature "{}" not defined. Please add it to ``features.py``'
-                    ThisFeature = _resolve_mechanic(
-                        mechanic=f,
-                        SuperClass=features.Feature,
-                        warning_message=msg,
-                    )
-                    _features.append(ThisFeature)
+                msg = 'Feature "{}" not defined. Please add it to ``features.py``'
+                _features = _resolve_many(
+                    val, SuperClass=features.Feature, warning_message=msg
+                )
                 self.custom_features += tuple(F(owner=self) for F in _features)
             elif (attr == "spells") or (attr == "spells_prepared"):
                 # Create a list of actual spell objects
-                _spells = []
-                for spell_name in val:
-                    msg = 'Spell "{}" not defined. Please add it to ``spells.py``'
-                    ThisSpell = _resolve_mechanic(
-                        mechanic=spell_name,
-                        SuperClass=spells.Spell,
-                        warning_message=msg,
-                    )
-                    _spells.append(ThisSpell)
+                msg = 'Spell "{}" not defined. Please add it to ``spells.py``'
+                _spells = _resolve_many(
+                    val, SuperClass=spells.Spell, warning_message=msg
+                )
                 # Sort by name
-                _spells.sort(key=lambda spell: spell.name)
+                _spells.sort(key=_NAME_KEY)
                 # Save list of spells to character atribute
                 if attr == "spells":
                     # Instantiate them all for the spells list
@@ -688,20 +872,15 @@ class Character(Entity):
                     # Instantiate them all for the spells list
                     self._spells_prepared = tuple(S() for S in _spells)
             elif attr == "infusions":
-                if hasattr(self, "Artificer"):
-                    _infusions = []
-                    for infusion_name in val:
-                        msg = (
-                            "Infusion '{}' not defined. Please add it to"
-                            " ``infusions.py``"
-                        )
-                        ThisInfusion = _resolve_mechanic(
-                            mechanic=infusion_name,
-                            SuperClass=infusions.Infusion,
-                            warning_message=msg,
-                        )
-                        _infusions.append(ThisInfusion)
-                    _infusions.sort(key=lambda infusion: infusion.name)
+                if "Artificer" in self._class_names:
+                    msg = (
+                        "Infusion '{}' not defined. Please add it to"
+                        " ``infusions.py``"
+                    )
+                    _infusions = _resolve_many(
+                        val, SuperClass=infusions.Infusion, warning_message=msg
+                    )
+                    _infusions.sort(key=_NAME_KEY)
                     self.infusions = tuple(i() for i in _infusions)
             elif type(val) not in (type, ModuleType):
                 # Some other generic attribute
@@ -713,12 +892,46 @@ class Character(Entity):
                 # Lookup general attributes
                 setattr(self, attr, val)
 
+    def skill_modifiers(self):
+        """Modifiers for all of the character's skills at once.
+
+        Gives the same values as reading each skill attribute
+        (eg. ``char.sleight_of_hand``), but only looks up each ability
+        and the skill proficiencies once.
+
+        Returns
+        =======
+        modifiers : dict
+          Skill modifiers keyed by attribute name.
+
+        """
+        proficiencies = [p.replace("_", " ") for p in self.skill_proficiencies]
+        ability_mods = {}
+        modifiers = {}
+        for attr, skill in _descriptors(type(self), Skill).items():
+            if attr in self.__dict__ or not isinstance(skill, Skill):
+                # Overridden on the instance or a subclass
+                modifiers[attr] = getattr(self, attr)
+                continue
+            ability = skill.ability_name
+            if ability not in ability_mods:
+                ability_mods[ability] = self._ability_modifier(ability)
+            modifiers[attr] = skill.modifier(self, ability_mods[ability], proficiencies)
+        return modifiers
+
+    def _ability_modifier(self, ability_name):
+        """Modifier for an ability (eg. "wisdom"), skipping the saving throw."""
+        ability = _descriptors(type(self), Ability).get(ability_name)
+        if not isinstance(ability, Ability):
+            return getattr(self, ability_name).modifier
+        return ability.modifier(self)
+
     def spell_save_dc(self, class_type):
-        ability_mod = getattr(self, class_type.spellcasting_ability).modifier
+        ability_mod = self._ability_modifier(class_type.spellcasting_ability)
         return 8 + self.proficiency_bonus + ability_mod
 
     def spell_attack_bonus(self, class_type):
-        ability_mod = getattr(self, class_type.spellcasting_ability).modifier
+        ability_mod = self._ability_modifier(class_type.spellcasting_ability)
         return self.proficiency_bonus + ability_mod
 
     def is_proficient(self, weapon: Weapon):
@@ -742,30 +955,21 @@ class Character(Entity):
 
     @property
     def proficiencies_text(self):
-        final_text = ""
-        all_proficiencies = tuple(self._proficiencies_text)
+        all_proficiencies = list(self._proficiencies_text)
         if self.has_class:
-            all_proficiencies += tuple(self.primary_class._proficiencies_text)
+            all_proficiencies.extend(self.primary_class._proficiencies_text)
         if self.num_classes > 1:
             for c in self.class_list[1:]:
-                all_proficiencies += tuple(c._multiclass_proficiencies_text)
+                all_proficiencies.extend(c._multiclass_proficiencies_text)
         if self.race is not None:
-            all_proficiencies += tuple(self.race.proficiencies_text)
+            all_proficiencies.extend(self.race.proficiencies_text)
         if self.background is not None:
-            all_proficiencies += tuple(self.background.proficiencies_text)
+            all_proficiencies.extend(self.background.proficiencies_text)
+        if not all_proficiencies:
+            return "."
         # Create a single string out of all the proficiencies
-        for txt in all_proficiencies:
-            if not final_text:
-                # Capitalize the first entry
-                txt = txt.capitalize()
-            else:
-                # Put a comma first
-                txt = ", " + txt
-                # Add this item to the list text
-            final_text += txt
-        # Add a period at the end
-        final_text += "."
-        return final_text
+        all_proficiencies[0] = all_proficiencies[0].capitalize()
+        return ", ".join(all_proficiencies) + "."
 
     @property
     def features_text(self):
@@ -782,7 +986,7 @@ class Character(Entity):
         s = ", ".join(
             [
                 f.name + ("**" if f.needs_implementation else "")
-                for f in sorted(self.magic_items, key=(lambda x: x.name))
+                for f in sorted(self.magic_items, key=_NAME_KEY)
             ]
         )
         if s:
@@ -823,12 +1027,20 @@ class Character(Entity):
 
         """
         if shield not in ("", "None", None):
-            try:
-                NewShield = find_content(shield, valid_classes=[armor.Shield])
-            except AttributeError:
-                # Not a string, so just treat it as Armor
-                NewShield = shield
-            self.shield = NewShield()
+            if isinstance(shield, armor.Shield):
+                new_shield = shield
+            elif isinstance(shield, type) and not issubclass(shield, armor.Shield):
+                # Not a shield class, so just treat it as Armor
+                new_shield = shield()
+            else:
+                msg = 'Unknown shield "{}". Please add it to ``armor.py``.'
+                NewShield = _resolve_mechanic(
+                    mechanic=shield,
+                    SuperClass=armor.Shield,
+                    warning_message=msg,
+                )
+                new_shield = NewShield()
+            self.shield = new_shield
 
     def wield_weapon(self, weapon):
         """Accepts a string and adds it to the list of wielded weapons.
@@ -839,18 +1051,38 @@ class Character(Entity):
           Case-insensitive string with a name of the weapon.
 
         """
-        # Retrieve the weapon class from the weapons module
-        if isinstance(weapon, weapons.Weapon):
-            ThisWeapon = type(weapon)
-        else:
-            msg = 'Unknown weapon "{}". Please add it to ``weapons.py``.'
-            ThisWeapon = _resolve_mechanic(
-                mechanic=weapon,
-                SuperClass=weapons.Weapon,
-                warning_message=msg,
-            )
-        # Save it to the array
-        self.weapons.append(ThisWeapon(wielder=self))
+        self.wield_weapons([weapon])
+
+    def wield_weapons(self, new_weapons):
+        """Accepts a list of strings and adds them to the wielded weapons.
+
+        Same as calling :py:meth:`wield_weapon` on each entry.
+
+        Parameters
+        ----------
+        new_weapons : str, list
+          Case-insensitive strings with the names of the weapons. A
+          single string is treated as one weapon.
+
+        """
+        if isinstance(new_weapons, str):
+            new_weapons = [new_weapons]
+        # Retrieve the weapon classes from the weapons module
+        msg = 'Unknown weapon "{}". Please add it to ``weapons.py``.'
+        NewWeapons = []
+        for weapon in new_weapons:
+            if isinstance(weapon, weapons.Weapon):
+                NewWeapons.append(type(weapon))
+            else:
+                NewWeapons.append(
+                    _resolve_mechanic(
+                        mechanic=weapon,
+                        SuperClass=weapons.Weapon,
+                        warning_message=msg,
+                    )
+                )
+        # Save them to the array
+        self.weapons.extend([NewWeapon(wielder=self) for NewWeapon in NewWeapons])
 
     @property
     def hit_dice(self):
@@ -861,9 +1093,10 @@ class Character(Entity):
 
     @property
     def hit_dice_faces(self):
-        # Not a valid function if multiclass
-        if self.num_classes > 1:
+        # Not a valid function if multiclass, so warn (once)
+        if self.num_classes > 1 and not self._warned_hit_dice_faces:
             warnings.warn("hit_dice_faces is not valid for multiclass characters")
+            self._warned_hit_dice_faces = True
         return self.primary_class.hit_dice_faces
 
     @hit_dice_faces.setter
@@ -872,43 +1105,35 @@ class Character(Entity):
 
     @property
     def proficiency_bonus(self):
-        if self.level < 5:
-            prof = 2
-        elif 5 <= self.level < 9:
-            prof = 3
-        elif 9 <= self.level < 13:
-            prof = 4
-        elif 13 <= self.level < 17:
-            prof = 5
-        elif 17 <= self.level:
-            prof = 6
-        return prof
+        # +2 at levels 1-4, rising by one every four levels to +6 at 17
+        level = min(max(self.level, 1), 20)
+        return (level - 1) // 4 + 2
 
     def can_assume_shape(self, shape: monsters.Monster):
-        return hasattr(self, "Druid") and self.Druid.can_assume_shape(shape)
+        return "Druid" in self._class_names and self.Druid.can_assume_shape(shape)
 
     @property
     def all_wild_shapes(self):
-        if hasattr(self, "Druid"):
+        if "Druid" in self._class_names:
             return self.Druid.all_wild_shapes
         else:
             return ()
 
     @property
     def wild_shapes(self):
-        if hasattr(self, "Druid"):
+        if "Druid" in self._class_names:
             return self.Druid.wild_shapes
         else:
             return ()
 
     @wild_shapes.setter
     def wild_shapes(self, new_shapes):
-        if hasattr(self, "Druid"):
+        if "Druid" in self._class_names:
             self.Druid.wild_shapes = new_shapes
 
     @property
     def infusions_text(self):
-        if hasattr(self, "Artificer"):
+        if "Artificer" in self._class_names:
             return tuple([i.name for i in self.infusions])
         else:
             return ()
@@ -932,14 +1157,10 @@ class Character(Entity):
         """
         # Parse the sheet type
         char_props.pop("sheet_type", "")
-        # Load classes
-        classes = char_props.get("classes", [])
-        # backwards compatability
-        if (len(classes) == 0) and ("character_class" in char_props):
-            char_props["classes"] = [
-                char_props.pop("character_class").lower().capitalize()
-            ]
-            char_props["levels"] = [str(char_props.pop("level"))]
+        # Load classes (backwards compatability)
+        if "character_class" in char_props and not char_props.get("classes"):
+            char_props["classes"] = [char_props.pop("character_class").capitalize()]
+            char_props["levels"] = [char_props.pop("level")]
         # Create the character with loaded properties
         char = Cls(**char_props)
         return char
@@ -950,111 +1171,56 @@ class Character(Entity):
             char=self,
         )
         # Render the template
-        src_path = os.path.join(os.path.dirname(__file__), "forms/")
-        text = (
-            jinja2.Environment(loader=jinja2.FileSystemLoader(src_path or "./"))
-            .get_template(template_file)
-            .render(context)
-        )
+        text = jinja_env.get_template(template_file).render(context)
+        # Leave an up-to-date file (and its timestamp) alone
+        try:
+            with open(filename, mode="r") as f:
+                if f.read() == text:
+                    return
+        except (OSError, UnicodeDecodeError):
+            # An unreadable file (eg. no permission) is just written again
+            pass
         # Save the file
         with open(filename, mode="w") as f:
             f.write(text)
 
     def to_pdf(self, filename, **kwargs):
-        from dungeonsheets.make_sheets import make_sheet
+        """Build the PDF sheet from this character's saved ``.py`` file.
+
+        *filename* may name either the ``.py`` file or the ``.pdf``
+        output; see :py:meth:`save` for writing the ``.py`` file.
 
+        """
         if filename.endswith(".pdf"):
-            filename = filename.replace("pdf", "py")
-        make_sheet(filename, character=self, flatten=kwargs.get("flatten", True))
+            filename = filename[:-4] + ".py"
+        make_sheet = _get_make_sheet()
+        make_sheet(filename, flatten=kwargs.get("flatten", True))
 
 
 # Add backwards compatibility for tests
-class Artificer(Character):
-    def __init__(self, level=1, **attrs):
-        attrs["classes"] = ["Artificer"]
-        attrs["levels"] = [level]
-        super().__init__(**attrs)
-
-
-class Barbarian(Character):
-    def __init__(self, level=1, **attrs):
-        attrs["classes"] = ["Barbarian"]
-        attrs["levels"] = [level]
-        super().__init__(**attrs)
-
-
-class Bard(Character):
-    def __init__(self, level=1, **attrs):
-        attrs["classes"] = ["Bard"]
-        attrs["levels"] = [level]
-        super().__init__(**attrs)
-
-
-class Cleric(Character):
-    def __init__(self, level=1, **attrs):
-        attrs["classes"] = ["Cleric"]
-        attrs["levels"] = [level]
-        super().__init__(**attrs)
-
-
-class Druid(Character):
-    def __init__(self, level=1, **attrs):
-        attrs["classes"] = ["Druid"]
-        attrs["levels"] = [level]
-        super().__init__(**attrs)
-
-
-class Fighter(Character):
-    def __init__(self, level=1, **attrs):
-        attrs["classes"] = ["Fighter"]
-        attrs["levels"] = [level]
-        super().__init__(**attrs)
-
-
-class Monk(Character):
-    def __init__(self, level=1, **attrs):
-        attrs["classes"] = ["Monk"]
-        attrs["levels"] = [level]
-        super().__init__(**attrs)
-
-
-class Paladin(Character):
-    def __init__(self, level=1, **attrs):
-        attrs["classes"] = ["Paladin"]
-        attrs["levels"] = [level]
-        super().__init__(**attrs)
-
-
-class Ranger(Character):
-    def __init__(self, level=1, **attrs):
-        attrs["classes"] = ["Ranger"]
-        attrs["levels"] = [level]
-        super().__init__(**attrs)
-
-
-class Rogue(Character):
-    def __init__(self, level=1, **attrs):
-        attrs["classes"] = ["Rogue"]
-        attrs["levels"] = [level]
-        super().__init__(**attrs)
-
-
-class Sorceror(Character):
-    def __init__(self, level=1, **attrs):
-        attrs["classes"] = ["Sorceror"]
-        attrs["levels"] = [level]
-        super().__init__(**attrs)
-
-
-class Warlock(Character):
-    def __init__(self, level=1, **attrs):
-        attrs["classes"] = ["Warlock"]
-        attrs["levels"] = [level]
-        super().__init__(**attrs)
-
+def _class_shim(class_name):
+    """Create a single-class ``Character`` subclass, eg. ``Wizard(level=3)``."""
 
-class Wizard(Character):
     def __init__(self, level=1, **attrs):
-        attrs["classes"] = ["Wizard"]
+        attrs["classes"] = [class_name]
         attrs["levels"] = [level]
-        super().__init__(**attrs)
+        super(Shim, self).__init__(**attrs)
+
+    attrs = {"__init__": __init__, "__module__": __name__}
+    Shim = type(class_name, (Character,), attrs)
+    return Shim
+
+
+Artificer = _class_shim("Artificer")
+Barbarian = _class_shim("Barbarian")
+Bard = _class_shim("Bard")
+Cleric = _class_shim("Cleric")
+Druid = _class_shim("Druid")
+Fighter = _class_shim("Fighter")
+Monk = _class_shim("Monk")
+Paladin = _class_shim("Paladin")
+Ranger = _class_shim("Ranger")
+Rogue = _class_shim("Rogue")
+Sorceror = _class_shim("Sorceror")
+Warlock = _class_shim("Warlock")
+Wizard = _class_shim("Wizard")
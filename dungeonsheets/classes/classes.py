@@ -117,6 +117,13 @@ class CharClass:
         else:
             return self.spell_slots_by_level[self.level][spell_level]
 
+    def spell_slots_all(self):
+        """Spell slots for every spell level (0 for cantrips) at once."""
+        if self.spell_slots_by_level is None:
+            return (0,) * 10
+        else:
+            return tuple(self.spell_slots_by_level[self.level])
+
     def __str__(self):
         s = "Level {:d} {:s}".format(self.level, self.name)
         if isinstance(self.subclass, SubClass):
@@ -21,10 +21,13 @@ class ContentRegistry:
 
     def __init__(self):
         self.modules = []
+        self._index = {}
 
     def add_module(self, new_module):
         if new_module not in self.modules:
             self.modules.append(new_module)
+            # New content may change how previously seen names resolve
+            self._index.clear()
 
     def findattr(self, name, valid_classes=[]):
         """Resolve the name of a piece of content to the corresponding Class.
@@ -36,7 +39,22 @@ class ContentRegistry:
           If given, only subclasses of classes in this list will be
           returned.
 
+        Successful lookups are remembered, so resolving the same name
+        again is a single dictionary lookup.
+
         """
+        if not isinstance(name, str):
+            return self._search_modules(name, valid_classes)
+        key = (name, tuple(valid_classes))
+        try:
+            attr = self._index[key]
+        except KeyError:
+            attr = self._search_modules(name, valid_classes)
+            self._index[key] = attr
+        return attr
+
+    def _search_modules(self, name, valid_classes):
+        """Look through each registered module for *name*."""
         # Come up with several options
         name = name.strip()
         # check for +X weapons, armor, shields
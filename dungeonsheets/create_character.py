@@ -96,7 +96,7 @@ class App(npyscreen.NPSAppManaged):
     def update_max_hp_roll(self):
         abil = self.getForm("ABILITIES")
         # Update max HP based on the class
-        hit_dice = [dice.read_dice_str(d) for d in self.character.hit_dice.split(" + ")]
+        hit_dice = dice.parse_all_dice(self.character.hit_dice)
         const = int((int(abil.constitution.value) - 10) / 2)
         hp_max = f"{hit_dice[0].faces + self.character.level*const}"
         hds = {}
@@ -115,7 +115,7 @@ class App(npyscreen.NPSAppManaged):
     def reroll_max_hp(self):
         abil = self.getForm("ABILITIES")
         # Update max HP based on the class
-        hit_dice = [dice.read_dice_str(d) for d in self.character.hit_dice.split(" + ")]
+        hit_dice = dice.parse_all_dice(self.character.hit_dice)
         const = int((int(abil.constitution.value) - 10) / 2)
         # Assume first hd given is from primary class
         hp_max = hit_dice[0].faces + const
@@ -131,7 +131,7 @@ class App(npyscreen.NPSAppManaged):
     def set_default_hp_max(self):
         abil = self.getForm("ABILITIES")
         # Update max HP based on the class
-        hit_dice = [dice.read_dice_str(d) for d in self.character.hit_dice.split(" + ")]
+        hit_dice = dice.parse_all_dice(self.character.hit_dice)
         const = int((int(abil.constitution.value) - 10) / 2)
         # Assume first hd given is from primary class
         hp_max = hit_dice[0].faces + const
@@ -25,6 +25,22 @@ def read_dice_str(dice_str):
     return dice
 
 
+def parse_all_dice(text):
+    """Interpret every D&D dice string found in *text*.
+
+    Useful for compound expressions, eg. the multiclass hit dice
+    '3d10 + 2d8'.
+
+    Returns
+    -------
+    dice : list
+      A list of named tuples with the scheme (num, faces), so
+      '3d10 + 2d8' returns [(num=3, faces=10), (num=2, faces=8)]
+
+    """
+    return [Dice(num=int(m[1]), faces=int(m[2])) for m in dice_re.finditer(text)]
+
+
 def roll(a, b=None):
     """roll(20) means roll 1d20, roll(2, 6) means roll 2d6"""
     if b is None:
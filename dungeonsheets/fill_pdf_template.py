@@ -32,6 +32,7 @@ def text_box(string):
 
 def create_character_pdf_template(character, basename, flatten=False):
     # Prepare the list of fields
+    skills = character.skill_modifiers()
     fields = {
         # Character description
         "CharacterName": character.name,
@@ -59,7 +60,7 @@ def create_character_pdf_template(character, basename, flatten=False):
         "AC": str(character.armor_class),
         "Initiative": str(character.initiative),
         "Speed": str(character.speed),
-        "Passive": 10 + character.perception,
+        "Passive": 10 + skills["perception"],
         # Saving throws (proficiencies handled later)
         "ST Strength": mod_str(character.strength.saving_throw),
         "ST Dexterity": mod_str(character.dexterity.saving_throw),
@@ -68,24 +69,24 @@ def create_character_pdf_template(character, basename, flatten=False):
         "ST Wisdom": mod_str(character.wisdom.saving_throw),
         "ST Charisma": mod_str(character.charisma.saving_throw),
         # Skills (proficiencies handled below)
-        "Acrobatics": mod_str(character.acrobatics),
-        "Animal": mod_str(character.animal_handling),
-        "Arcana": mod_str(character.arcana),
-        "Athletics": mod_str(character.athletics),
-        "Deception ": mod_str(character.deception),
-        "History ": mod_str(character.history),
-        "Insight": mod_str(character.insight),
-        "Intimidation": mod_str(character.intimidation),
-        "Investigation ": mod_str(character.investigation),
-        "Medicine": mod_str(character.medicine),
-        "Nature": mod_str(character.nature),
-        "Perception ": mod_str(character.perception),
-        "Performance": mod_str(character.performance),
-        "Persuasion": mod_str(character.persuasion),
-        "Religion": mod_str(character.religion),
-        "SleightofHand": mod_str(character.sleight_of_hand),
-        "Stealth ": mod_str(character.stealth),
-        "Survival": mod_str(character.survival),
+        "Acrobatics": mod_str(skills["acrobatics"]),
+        "Animal": mod_str(skills["animal_handling"]),
+        "Arcana": mod_str(skills["arcana"]),
+        "Athletics": mod_str(skills["athletics"]),
+        "Deception ": mod_str(skills["deception"]),
+        "History ": mod_str(skills["history"]),
+        "Insight": mod_str(skills["insight"]),
+        "Intimidation": mod_str(skills["intimidation"]),
+        "Investigation ": mod_str(skills["investigation"]),
+        "Medicine": mod_str(skills["medicine"]),
+        "Nature": mod_str(skills["nature"]),
+        "Perception ": mod_str(skills["perception"]),
+        "Performance": mod_str(skills["performance"]),
+        "Persuasion": mod_str(skills["persuasion"]),
+        "Religion": mod_str(skills["religion"]),
+        "SleightofHand": mod_str(skills["sleight_of_hand"]),
+        "Stealth ": mod_str(skills["stealth"]),
+        "Survival": mod_str(skills["survival"]),
         # Hit points
         "HDTotal": character.hit_dice,
         "HPMax": str(character.hp_max),
@@ -226,21 +227,22 @@ def create_spells_pdf_template(character, basename, flatten=False):
     def spell_level(x):
         return x or 0
 
+    slots = character.spell_slots_all()
     fields = {
         "Spellcasting Class 2": classes_and_levels,
         "SpellcastingAbility 2": abilities,
         "SpellSaveDC  2": DCs,
         "SpellAtkBonus 2": bonuses,
         # Number of spell slots
-        "SlotsTotal 19": spell_level(character.spell_slots(1)),
-        "SlotsTotal 20": spell_level(character.spell_slots(2)),
-        "SlotsTotal 21": spell_level(character.spell_slots(3)),
-        "SlotsTotal 22": spell_level(character.spell_slots(4)),
-        "SlotsTotal 23": spell_level(character.spell_slots(5)),
-        "SlotsTotal 24": spell_level(character.spell_slots(6)),
-        "SlotsTotal 25": spell_level(character.spell_slots(7)),
-        "SlotsTotal 26": spell_level(character.spell_slots(8)),
-        "SlotsTotal 27": spell_level(character.spell_slots(9)),
+        "SlotsTotal 19": spell_level(slots[1]),
+        "SlotsTotal 20": spell_level(slots[2]),
+        "SlotsTotal 21": spell_level(slots[3]),
+        "SlotsTotal 22": spell_level(slots[4]),
+        "SlotsTotal 23": spell_level(slots[5]),
+        "SlotsTotal 24": spell_level(slots[6]),
+        "SlotsTotal 25": spell_level(slots[7]),
+        "SlotsTotal 26": spell_level(slots[8]),
+        "SlotsTotal 27": spell_level(slots[9]),
     }
     # Cantrips
     cantrip_fields = (f"Spells 10{i}" for i in (14, 16, 17, 18, 19, 20, 21, 22))
@@ -36,6 +36,12 @@ class Race:
             self.features_by_level[i] = [
                 f(owner=self.owner) for f in cls.features_by_level[i]
             ]
+        # All level-based features gained by each character level
+        self._features_upto = [frozenset()]
+        for i in range(1, 21):
+            self._features_upto.append(
+                self._features_upto[-1].union(self.features_by_level[i])
+            )
         self.spells_known = [S() for S in cls.spells_known]
 
     @property
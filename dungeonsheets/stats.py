@@ -55,10 +55,15 @@ class Ability:
             # ability score dictionary exists but doesn't have this ability
             obj._ability_scores[self.ability_name] = self.default_value
 
-    def __get__(self, entity, Entity):
+    def modifier(self, entity):
+        """The ability modifier for *entity*, without the saving throw."""
         self._check_dict(entity)
         score = entity._ability_scores[self.ability_name]
-        modifier = math.floor((score - 10) / 2)
+        return math.floor((score - 10) / 2)
+
+    def __get__(self, entity, Entity):
+        modifier = self.modifier(entity)
+        score = entity._ability_scores[self.ability_name]
         # Check for proficiency
         saving_throw = modifier
         if self.ability_name is not None and hasattr(
@@ -90,9 +95,25 @@ class Skill:
     def __get__(self, entity, owner):
         log.debug("Getting skill '%s' for '%s'", self.skill_name, entity.name)
         ability = getattr(entity, self.ability_name)
-        modifier = ability.modifier
-        # Check for proficiency
         proficiencies = [p.replace("_", " ") for p in entity.skill_proficiencies]
+        return self.modifier(entity, ability.modifier, proficiencies)
+
+    def modifier(self, entity, ability_modifier, proficiencies):
+        """Compute this skill's modifier from an already known ability modifier.
+
+        Parameters
+        ----------
+        entity
+          The character that has this skill.
+        ability_modifier : int
+          The modifier for the ability this skill is based on.
+        proficiencies : Sequence[str]
+          The entity's skill proficiencies, with spaces instead of
+          underscores.
+
+        """
+        modifier = ability_modifier
+        # Check for proficiency
         is_proficient = self.skill_name in proficiencies
         log.debug(
             "%s is proficient in %s: %s", entity.name, self.skill_name, is_proficient
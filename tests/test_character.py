@@ -1,16 +1,18 @@
 #!/usr/bin/env python
 
-from unittest import TestCase, expectedFailure
+from unittest import TestCase, expectedFailure, mock
+import os
+import tempfile
 import warnings
 
-from dungeonsheets import race, monsters, exceptions, spells, infusions
+from dungeonsheets import race, monsters, exceptions, spells, infusions, features
 from dungeonsheets.character import (
     Character,
     Wizard,
     Druid,
     _resolve_mechanic,
 )
-from dungeonsheets.weapons import Weapon, Shortsword
+from dungeonsheets.weapons import Weapon, Shortsword, Longbow
 from dungeonsheets.armor import Armor, LeatherArmor, Shield
 
 
@@ -27,10 +29,22 @@ class TestCharacter(TestCase):
         char.level = 2
         char.hit_dice_faces = 10
         self.assertEqual(char.hit_dice, "2d10")
+        # Check that the value follows changes
+        char.level = 3
+        self.assertEqual(char.hit_dice, "3d10")
+        char.hit_dice_faces = 8
+        self.assertEqual(char.hit_dice, "3d8")
+        # Multiclass, levelling a secondary class directly
+        char = Character(classes=["Wizard", "Cleric"], levels=[3, 2])
+        char.class_list[1].level = 4
+        self.assertEqual(char.hit_dice, "3d6 + 4d8")
 
     def test_max_hp(self):
         char = Wizard(level=3, constitution=12)
         self.assertEqual(char.hp_max, 17)
+        # Odd hit dice (eg. from a character file)
+        char = Character(classes=["Wizard"], levels=[3], hit_dice_faces=7)
+        self.assertEqual(char.hp_max, 16)
 
     def test_set_attrs(self):
         char = Character()
@@ -90,6 +104,20 @@ class TestCharacter(TestCase):
 
         NewSpell = _resolve_mechanic("hocus_pocus", spells.Spell)
         self.assertTrue(issubclass(NewSpell, spells.Spell))
+        # Check that repeat lookups give back the same class
+        MageHand = _resolve_mechanic("mage_hand", spells.Spell)
+        self.assertIs(_resolve_mechanic("mage_hand", spells.Spell), MageHand)
+        # Check that unknown mechanics are only warned about once
+        msg = "Spell '{}' not found."
+        with self.assertWarns(UserWarning):
+            _resolve_mechanic("abra_cadabra", spells.Spell, msg)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            _resolve_mechanic("abra_cadabra", spells.Spell, msg)
+        self.assertEqual(caught, [])
+        # A different message is still shown
+        with self.assertWarns(UserWarning):
+            _resolve_mechanic("abra_cadabra", spells.Spell, "No spell '{}'.")
 
         # Test direct resolution of a proper subclass
         class MySpell(spells.Spell):
@@ -123,6 +151,101 @@ class TestCharacter(TestCase):
         sword = char.weapons[0]
         self.assertEqual(sword.attack_modifier, 5)
 
+    def test_wield_weapons(self):
+        char = Character()
+        char.wield_weapons(["shortsword", Shortsword()])
+        self.assertEqual(len(char.weapons), 2)
+        for weapon in char.weapons:
+            self.assertIsInstance(weapon, Shortsword)
+            self.assertIs(weapon.wielder, char)
+        # A single string is one weapon
+        char.wield_weapons("shortsword")
+        self.assertEqual(len(char.weapons), 3)
+
+    def test_cached_features(self):
+        char = Character(classes=["Fighter"], levels=[1])
+        num_features = len(char.features)
+        # Check that changing the level refreshes the features
+        char.level = 3
+        self.assertGreater(len(char.features), num_features)
+        # Check that adding features refreshes the features
+        num_features = len(char.features)
+        char.set_attrs(features=["lucky"])
+        self.assertEqual(len(char.features), num_features + 1)
+        # Check that appending custom features refreshes the features
+        char.custom_features.append(features.Alert(owner=char))
+        self.assertTrue(char.has_feature(features.Alert))
+
+    def test_cached_direct_assignment(self):
+        char = Character(classes=["Wizard"], levels=[1])
+        # Replacing the custom features with a list of the same length
+        char.custom_features = [features.Lucky(owner=char)]
+        self.assertTrue(char.has_feature(features.Lucky))
+        char.custom_features = [features.Alert(owner=char)]
+        self.assertTrue(char.has_feature(features.Alert))
+        self.assertFalse(char.has_feature(features.Lucky))
+        # Extra weapon proficiencies
+        self.assertNotIn(Longbow, char.weapon_proficiencies)
+        char.other_weapon_proficiencies = (Longbow,)
+        self.assertIn(Longbow, char.weapon_proficiencies)
+        # Spells
+        self.assertNotIn(spells.MageHand(), char.spells)
+        char._spells = (spells.MageHand(),)
+        self.assertIn(spells.MageHand(), char.spells)
+        char._spells_prepared = (spells.Shield(),)
+        self.assertIn(spells.Shield(), char.spells_prepared)
+
+    def test_cached_features_secondary_class(self):
+        char = Character(classes=["Wizard", "Cleric"], levels=[3, 1])
+        names = [f.name for f in char.features]
+        self.assertNotIn("Channel Divinity: Turn Undead", names)
+        # Level up the secondary class directly
+        char.class_list[1].level = 2
+        names = [f.name for f in char.features]
+        self.assertIn("Channel Divinity: Turn Undead", names)
+
+    def test_race_features_by_level(self):
+        # Protector aasimar gain Radiant Soul at level 3
+        char = Character(classes=["Wizard"], levels=[2], race="protector aasimar")
+        self.assertFalse(char.has_feature(features.RadiantSoul))
+        char.level = 3
+        self.assertTrue(char.has_feature(features.RadiantSoul))
+
+    def test_has_feature(self):
+        char = Character(classes=["Fighter"], levels=[1])
+        self.assertTrue(char.has_feature(features.SecondWind))
+        # Parent classes of a feature also count
+        self.assertTrue(char.has_feature(features.Feature))
+        self.assertFalse(char.has_feature(features.Lucky))
+        # Check that the feature list is refreshed
+        char.set_attrs(features=["lucky"])
+        self.assertTrue(char.has_feature(features.Lucky))
+
+    def test_class_shim_subclass(self):
+        class Mixin(Character):
+            def __init__(self, **attrs):
+                self.mixin_called = True
+                super().__init__(**attrs)
+
+        class MyWizard(Wizard, Mixin):
+            pass
+
+        char = MyWizard(level=3, name="Inara")
+        self.assertTrue(char.mixin_called)
+        self.assertEqual(char.class_names, ["Wizard"])
+        self.assertEqual(char.level, 3)
+
+    def test_clear_saving_throws(self):
+        class MyWizard(Wizard):
+            _saving_throw_proficiencies = ("strength",)
+
+        # clear() resets the instance, so the class's saving throws apply
+        char = MyWizard()
+        self.assertEqual(
+            tuple(char.saving_throw_proficiencies), ("intelligence", "wisdom")
+        )
+        self.assertEqual(char.strength.saving_throw, 0)
+
     def test_str(self):
         char = Wizard(name="Inara")
         self.assertEqual(str(char), "Inara")
@@ -145,6 +268,8 @@ class TestCharacter(TestCase):
     def test_proficiencies_text(self):
         char = Character()
         char._proficiencies_text = ("hello", "world")
+        self.assertTrue(char.proficiencies_text.startswith("Hello, world, "))
+        self.assertTrue(char.proficiencies_text.endswith("."))
         self.assertIn("hello", char.proficiencies_text.lower())
         self.assertIn("world", char.proficiencies_text.lower())
         # Check for extra proficiencies
@@ -203,6 +328,12 @@ class TestCharacter(TestCase):
         self.assertEqual(char.spell_slots(spell_level=1), 3)
         self.assertEqual(char.spell_slots(spell_level=2), 0)
 
+    def test_spell_save_dc(self):
+        char = Wizard(level=1, intelligence=16)
+        wizard = char.primary_class
+        self.assertEqual(char.spell_save_dc(wizard), 13)
+        self.assertEqual(char.spell_attack_bonus(wizard), 5)
+
     def test_equip_armor(self):
         char = Character(dexterity=16)
         char.wear_armor("leather armor")
@@ -225,6 +356,18 @@ class TestCharacter(TestCase):
         # Try passing an Armor object directly
         char.wield_shield(Shield)
         self.assertEqual(char.armor_class, 15)
+        # Try passing a Shield instance
+        shield = Shield()
+        char.wield_shield(shield)
+        self.assertIs(char.shield, shield)
+        # Other armor classes are used as they are
+        char.wield_shield(LeatherArmor)
+        self.assertIsInstance(char.shield, LeatherArmor)
+        # Unknown shields give a warning and a generic shield
+        with self.assertWarns(UserWarning):
+            char.wield_shield("mirror of warding")
+        self.assertIsInstance(char.shield, Shield)
+        self.assertEqual(char.shield.name, "Mirror Of Warding")
 
     def test_speed(self):
         # Check that the speed pulls from the character's race
@@ -239,6 +382,53 @@ class TestCharacter(TestCase):
         char = Character.load({"name": "Dave", "sheet_type": "character"})
         self.assertFalse(hasattr(char, "sheet_type"),
                          "'sheet_type' not stripped from char props")
+        # Check the old single-class format
+        char = Character.load({"name": "Dave", "character_class": "WIZARD", "level": 3})
+        self.assertEqual(char.class_names, ["Wizard"])
+        self.assertEqual(char.level, 3)
+
+    def test_save(self):
+        char = Character(name="Dave", classes=["Wizard"], levels=[3])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "dave.py")
+            char.save(filename)
+            with open(filename) as f:
+                text = f.read()
+            # Check that saving unchanged content doesn't rewrite the file
+            os.utime(filename, ns=(0, 0))
+            char.save(filename)
+            self.assertEqual(os.stat(filename).st_mtime_ns, 0)
+            # Save again after a change
+            char.name = "Dave 2"
+            char.save(filename)
+            with open(filename) as f:
+                text2 = f.read()
+            # A file that can't be read back is still written
+            real_open = open
+
+            def write_only_open(fname, mode="r", **kwargs):
+                if mode == "r":
+                    raise PermissionError(fname)
+                return real_open(fname, mode=mode, **kwargs)
+
+            char.name = "Dave 3"
+            with mock.patch("builtins.open", write_only_open):
+                char.save(filename)
+            with open(filename) as f:
+                text3 = f.read()
+        self.assertIn('name = "Dave"', text)
+        self.assertIn("levels = [3]", text)
+        self.assertIn('name = "Dave 2"', text2)
+        self.assertIn('name = "Dave 3"', text3)
+
+    def test_to_pdf(self):
+        char = Character(name="Dave", classes=["Wizard"], levels=[3])
+        make_sheet = mock.Mock()
+        get_make_sheet = "dungeonsheets.character._get_make_sheet"
+        with mock.patch(get_make_sheet, return_value=make_sheet):
+            char.to_pdf("/tmp/pdfarchive/x.pdf")
+        # The .pdf name is swapped for the .py file holding the character
+        make_sheet.assert_called_once_with("/tmp/pdfarchive/x.py", flatten=True)
 
 
 class DruidTestCase(TestCase):
@@ -50,4 +50,19 @@ class TestContentRegistry(TestCase):
         creg.add_module(TestClassB)
         # Direct access
         self.assertEqual(creg.findattr("my_attr", valid_classes=[int]), test_module.my_attr)
-        
+
+    def test_findattr_new_module(self):
+        """Check that adding a module clears previously found content."""
+
+        class TestClass:
+            my_attr = 47
+
+        class TestClassB:
+            my_attr = 48.0
+
+        creg = ContentRegistry()
+        creg.add_module(TestClass)
+        self.assertEqual(creg.findattr("my_attr"), 47)
+        creg.add_module(TestClassB)
+        with self.assertRaises(RuntimeError):
+            creg.findattr("my_attr")
@@ -19,6 +19,13 @@ class TestDice(TestCase):
         with self.assertRaises(DiceError):
             dice.read_dice_str("Ed15")
 
+    def test_parse_all_dice(self):
+        out = dice.parse_all_dice("3d10 + 2D8")
+        self.assertEqual(out, [(3, 10), (2, 8)])
+        self.assertEqual(out[1].faces, 8)
+        # No dice in the string
+        self.assertEqual(dice.parse_all_dice("none"), [])
+
     def test_simple_rolling(self):
         num_tests = 100
         for _ in range(num_tests):
@@ -32,6 +32,19 @@ class TestFeatures(TestCase):
         feature = NewFeature()
         print(feature, feature.__class__, type(feature))
 
+    def test_fighting_style_placeholder(self):
+        # Each class adds its own "Select One" fighting style placeholder
+        char = character.Character(classes=["fighter", "paladin"], levels=[1, 2])
+        names = [f.name for f in char.features]
+        self.assertEqual(names.count("Fighting Style (Select One)"), 2)
+        # A chosen fighting style replaces all the placeholders
+        char = character.Character(
+            classes=["fighter", "paladin"], levels=[1, 2], features=["archery"]
+        )
+        names = [f.name for f in char.features]
+        self.assertNotIn("Fighting Style (Select One)", names)
+        self.assertIn("Fighting Style (Archery)", names)
+
 
 class BardTests(TestCase):
     def test_bardic_inspiration(self):
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 from unittest import TestCase
+import warnings
 
 from dungeonsheets.character import Character
 from dungeonsheets.weapons import Shortsword
@@ -40,6 +41,43 @@ class TestMulticlass(TestCase):
         self.assertEqual(char.spell_slots(spell_level=2), 3)
         self.assertEqual(char.spell_slots(spell_level=3), 3)
         self.assertEqual(char.spell_slots(spell_level=4), 0)
+        # All spell slots at once
+        slots = char.spell_slots_all()
+        self.assertEqual(len(slots), 10)
+        self.assertEqual(slots, tuple(char.spell_slots(i) for i in range(10)))
+        # Check that changing levels updates the spell slots
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="Unable to tell which level")
+            char.level = 8
+        self.assertEqual(char.spell_slots(spell_level=5), 1)
+        self.assertEqual(char.spell_slots_all()[5], 1)
+        # Artificer levels round up: equivalent spellcasting level 4
+        char = Character(
+            name="Multiclass", classes=["artificer", "wizard"], levels=[3, 2]
+        )
+        self.assertEqual(char.spell_slots(spell_level=1), 4)
+        self.assertEqual(char.spell_slots(spell_level=2), 3)
+        self.assertEqual(char.spell_slots(spell_level=3), 0)
+        # Check that levelling a class directly updates the slots
+        char = Character(
+            name="Multiclass", classes=["wizard", "cleric"], levels=[3, 2]
+        )
+        self.assertEqual(char.spell_slots(spell_level=3), 2)
+        char.class_list[1].level = 4
+        self.assertEqual(char.spell_slots(spell_level=3), 3)
+        self.assertEqual(char.spell_slots_all()[3], 3)
+
+    def test_hit_dice_faces(self):
+        char = Character(
+            name="Multiclass", classes=["wizard", "fighter"], levels=[5, 4]
+        )
+        self.assertEqual(char.hit_dice, "5d6 + 4d10")
+        # Check that the multiclass warning is only given once
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self.assertEqual(char.hit_dice_faces, 6)
+            self.assertEqual(char.hit_dice_faces, 6)
+        self.assertEqual(len(caught), 1)
 
     def test_proficiencies(self):
         char1 = Character(
@@ -84,3 +84,24 @@ class TestStats(TestCase):
         # Check for a proficiency with spaces in the name
         my_class.skill_proficiencies = ["sleight_of_hand"]
         self.assertEqual(my_class.sleight_of_hand, 4)
+
+    def test_skill_modifiers(self):
+        """Check that all skills can be computed at once."""
+        char = character.Character(
+            dexterity=14, wisdom=12, skill_proficiencies=["sleight_of_hand"]
+        )
+        modifiers = char.skill_modifiers()
+        self.assertEqual(len(modifiers), 18)
+        self.assertEqual(modifiers["sleight_of_hand"], 4)
+        for skill, modifier in modifiers.items():
+            self.assertEqual(modifier, getattr(char, skill), skill)
+
+        # Check skills overridden on the instance or a subclass
+        class Sneaky(character.Character):
+            stealth = 4
+
+        char = Sneaky(perception=9)
+        modifiers = char.skill_modifiers()
+        self.assertEqual(len(modifiers), 18)
+        self.assertEqual(modifiers["perception"], 9)
+        self.assertEqual(modifiers["stealth"], 4)